@@ -1,7 +1,7 @@
 import json
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, ForeignKey, Integer
+from sqlalchemy import String, Text, DateTime, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database import Base
@@ -52,3 +52,16 @@ class Source(Base):
     full_text: Mapped[str] = mapped_column(Text, nullable=True) # cleaned full text
 
     brief: Mapped["Brief"] = relationship("Brief", back_populates="sources")
+
+
+class Attribution(Base):
+    """Precomputed key point -> source passage match, one row per key point."""
+    __tablename__ = "attributions"
+    __table_args__ = (UniqueConstraint("brief_id", "key_point_index"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    brief_id: Mapped[int] = mapped_column(ForeignKey("briefs.id"), nullable=False, index=True)
+    key_point_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), nullable=True)
+    start: Mapped[int] = mapped_column(Integer, nullable=True)  # char offset into full_text
+    end: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -4,10 +4,15 @@ import json
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
 
 from database import get_db
-from models import Brief, Source
-from schemas import BriefCreateRequest, BriefListItem, BriefOut, SourceOut
+from models import Attribution, Brief, Source
+from schemas import (
+    BriefCreateRequest, BriefListItem, BriefOut, CompareKeyPoint, CompareOut,
+    CompareSource, SourceOut,
+)
+from services.attribution import attribute_key_points
 from services.fetcher import fetch_and_clean
 from services.llm import generate_brief
 
@@ -53,15 +58,22 @@ async def create_brief(payload: BriefCreateRequest, db: AsyncSession = Depends(g
     db.add(brief)
     await db.flush()  # get ID before adding sources
 
+    sources = []
     for src in fetched:
         source = Source(
             brief_id=brief.id,
             url=src["url"],
             title=src.get("title"),
-            snippet=_pick_snippet(src.get("text"), brief_data),
             full_text=src.get("text", ""),
         )
         db.add(source)
+        sources.append(source)
+    await db.flush()  # get source IDs before attributing key points
+
+    # --- Precompute key point -> source passage attribution ---
+    matches = _store_attributions(db, brief, sources)
+    for source in sources:
+        source.snippet = _pick_snippet(source, matches)
 
     await db.commit()
     await db.refresh(brief)
@@ -115,14 +127,74 @@ async def get_brief(brief_id: int, db: AsyncSession = Depends(get_db)):
     return _brief_to_out(brief, sources)
 
 
+@router.get("/{brief_id}/compare", response_model=CompareOut)
+async def compare_sources(brief_id: int, db: AsyncSession = Depends(get_db)):
+    """Return the precomputed source x key point attribution matrix for a brief."""
+    result = await db.execute(select(Brief).where(Brief.id == brief_id))
+    brief = result.scalar_one_or_none()
+    if not brief:
+        raise HTTPException(status_code=404, detail="Brief not found.")
+
+    # Only the columns the matrix needs; passages are sliced out by the database
+    src_result = await db.execute(
+        select(Source.id, Source.url, Source.title).where(Source.brief_id == brief_id)
+    )
+    sources = src_result.all()
+
+    matches = await _load_attributions(db, brief_id)
+
+    # Briefs created before attribution was stored: compute once and persist
+    if brief.key_points_list() and not matches:
+        full_result = await db.execute(select(Source).where(Source.brief_id == brief_id))
+        _store_attributions(db, brief, full_result.scalars().all())
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A concurrent request stored them first; use its rows
+            await db.rollback()
+            await db.refresh(brief)  # rollback expired it
+        matches = await _load_attributions(db, brief_id)
+
+    return _brief_to_compare(brief, sources, matches)
+
+
 # ---- Helpers ----
 
-def _pick_snippet(text: str | None, brief_data: dict) -> str | None:
-    """Try to find a matching snippet from key_points for this source."""
-    if not text:
+SNIPPET_FALLBACK = 300  # chars of full text used when no key point matched a source
+
+
+def _store_attributions(db: AsyncSession, brief: Brief, sources: list) -> list[Attribution]:
+    """Match the brief's key points against source texts and add the rows to the session."""
+    matches = []
+    for i, m in enumerate(attribute_key_points(brief.key_points_list(), sources)):
+        row = Attribution(brief_id=brief.id, key_point_index=i, **m)
+        db.add(row)
+        matches.append(row)
+    return matches
+
+
+async def _load_attributions(db: AsyncSession, brief_id: int) -> list[tuple[Attribution, str | None]]:
+    """Return each stored attribution with its matched passage text."""
+    passage = func.substr(
+        Source.full_text, Attribution.start + 1, Attribution.end - Attribution.start
+    )
+    result = await db.execute(
+        select(Attribution, passage)
+        .outerjoin(Source, Source.id == Attribution.source_id)
+        .where(Attribution.brief_id == brief_id)
+        .order_by(Attribution.key_point_index)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+def _pick_snippet(source: Source, matches: list[Attribution]) -> str | None:
+    """Use the first key point passage matched in this source, else the opening text."""
+    if not source.full_text:
         return None
-    # Return first 300 chars as fallback snippet
-    return text[:300]
+    for m in matches:
+        if m.source_id == source.id and m.start is not None:
+            return source.full_text[m.start:m.end]
+    return source.full_text[:SNIPPET_FALLBACK]
 
 
 def _brief_to_out(brief: Brief, sources: list) -> BriefOut:
@@ -140,3 +212,35 @@ def _brief_to_out(brief: Brief, sources: list) -> BriefOut:
             for s in sources
         ],
     )
+
+
+def _brief_to_compare(
+    brief: Brief, sources: list, matches: list[tuple[Attribution, str | None]]
+) -> CompareOut:
+    by_source: dict[int, list[int]] = {s.id: [] for s in sources}
+    by_index = {m.key_point_index: (m, passage) for m, passage in matches}
+    key_points = []
+    for i, kp in enumerate(brief.key_points_list()):
+        m, passage = by_index.get(i, (None, None))
+        source_id = m.source_id if m else None
+        if source_id in by_source:
+            by_source[source_id].append(i)
+        key_points.append(CompareKeyPoint(
+            point=kp.get("point") or "",
+            source_id=source_id,
+            snippet=passage or None,
+            start=m.start if m else None,
+            end=m.end if m else None,
+        ))
+
+    return CompareOut(
+        id=brief.id,
+        title=brief.title,
+        topic_tags=brief.topic_tags_list(),
+        key_points=key_points,
+        sources=[
+            CompareSource(id=s.id, url=s.url, title=s.title, key_points=by_source[s.id])
+            for s in sources
+        ],
+        conflicting_claims=brief.conflicting_claims_list(),
+    )
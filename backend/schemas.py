@@ -72,6 +72,30 @@ class BriefOut(BaseModel):
         from_attributes = True
 
 
+class CompareKeyPoint(BaseModel):
+    point: str
+    source_id: int | None
+    snippet: str | None     # best-matching passage from the source's full text
+    start: int | None       # char offsets of that passage in the full text
+    end: int | None
+
+
+class CompareSource(BaseModel):
+    id: int
+    url: str
+    title: str | None
+    key_points: list[int]   # indices into CompareOut.key_points
+
+
+class CompareOut(BaseModel):
+    id: int
+    title: str
+    topic_tags: list[str]
+    key_points: list[CompareKeyPoint]
+    sources: list[CompareSource]
+    conflicting_claims: list[dict[str, Any]]
+
+
 class HealthOut(BaseModel):
     backend: str
     database: str
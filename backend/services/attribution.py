@@ -0,0 +1,121 @@
+import re
+from collections import defaultdict
+
+NGRAM = 3               # word n-gram size used for the passage index
+MIN_SCORE = 0.25        # fraction of query n-grams that must line up to accept a match
+REASSIGN_SCORE = 0.6    # stronger match needed to move a key point off its cited source
+BAND = 2                # word offsets pooled together when voting, to tolerate small edits
+
+_TOKEN_RE = re.compile(r"\S+")
+_STRIP_RE = re.compile(r"[^\w]+")
+
+
+class PassageIndex:
+    """
+    Word n-gram index over a source's full text.
+
+    Tokens are lowercased and stripped of punctuation so quotes that differ
+    only in casing, spacing or punctuation still line up. Each token keeps
+    its character span in the original text, so matches map back to offsets.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.words: list[str] = []
+        self.spans: list[tuple[int, int]] = []
+        for m in _TOKEN_RE.finditer(text):
+            word = _normalize(m.group())
+            if word:
+                self.words.append(word)
+                self.spans.append((m.start(), m.end()))
+
+        self.grams: dict[tuple[str, ...], list[int]] = defaultdict(list)
+        for i in range(len(self.words) - NGRAM + 1):
+            self.grams[tuple(self.words[i:i + NGRAM])].append(i)
+
+    def find(self, query: str) -> tuple[int, int, float] | None:
+        """
+        Locate the passage best matching `query`.
+        Returns (start, end, score) character offsets into the text, or None.
+        Queries shorter than NGRAM words are too ambiguous to place and never match.
+        """
+        q = [w for w in (_normalize(t) for t in _TOKEN_RE.findall(query or "")) if w]
+        if len(q) < NGRAM or not self.words:
+            return None
+
+        # Text positions of every query n-gram hit, keyed by alignment offset
+        total = len(q) - NGRAM + 1
+        hits: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        for i in range(total):
+            for pos in self.grams.get(tuple(q[i:i + NGRAM]), ()):
+                hits[pos - i].append((i, pos))
+        if not hits:
+            return None
+
+        # Pool neighbouring offsets so an inserted or dropped word doesn't split the vote
+        best_count, best_band = 0, []
+        for offset in hits:
+            band = [h for o in range(offset - BAND, offset + BAND + 1) for h in hits.get(o, ())]
+            count = len({i for i, _ in band})
+            if count > best_count:
+                best_count, best_band = count, band
+
+        score = best_count / total
+        if score < MIN_SCORE:
+            return None
+
+        # Span only the words the matching n-grams cover
+        positions = [pos for _, pos in best_band]
+        first = min(positions)
+        last = max(positions) + NGRAM - 1
+        return self.spans[first][0], self.spans[last][1], score
+
+
+def attribute_key_points(key_points: list[dict], sources: list) -> list[dict]:
+    """
+    Match every key point to a source and its best passage.
+
+    `sources` are persisted Source rows. The source the LLM cited is tried
+    first; if its text doesn't contain the quote, the other sources are
+    searched, but a cited source is only overridden by a strong match
+    (REASSIGN_SCORE). Returns one entry per key point, in order:
+        {"source_id": int | None, "start": int | None, "end": int | None}
+    """
+    indexes = {s.id: PassageIndex(s.full_text) for s in sources if s.full_text}
+    by_url = {_normalize_url(s.url): s.id for s in sources}
+
+    results = []
+    for kp in key_points:
+        query = kp.get("snippet") or kp.get("point") or ""
+        cited = by_url.get(_normalize_url(kp.get("source_url", "")))
+
+        match = None
+        if cited in indexes:
+            found = indexes[cited].find(query)
+            if found:
+                match = (cited, found)
+        if not match:
+            threshold = REASSIGN_SCORE if cited is not None else MIN_SCORE
+            best = None
+            for source_id, index in indexes.items():
+                if source_id == cited:
+                    continue
+                found = index.find(query)
+                if found and found[2] >= threshold and (best is None or found[2] > best[1][2]):
+                    best = (source_id, found)
+            match = best
+
+        if match:
+            source_id, (start, end, _) = match
+            results.append({"source_id": source_id, "start": start, "end": end})
+        else:
+            results.append({"source_id": cited, "start": None, "end": None})
+    return results
+
+
+def _normalize(token: str) -> str:
+    return _STRIP_RE.sub("", token).lower()
+
+
+def _normalize_url(url: str) -> str:
+    return (url or "").strip().rstrip("/").lower()
@@ -0,0 +1,9 @@
+import os
+import sys
+from pathlib import Path
+
+# Backend modules are imported top-level (as in main.py), so put backend/ on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Settings are read at import time; tests never call the LLM
+os.environ.setdefault("GROQ_API_KEY", "test")
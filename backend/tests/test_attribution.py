@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from services.attribution import REASSIGN_SCORE, PassageIndex, attribute_key_points
+
+TEXT = (
+    "Intro paragraph here. The Quick brown fox, jumps over the lazy dog! "
+    "Then more text follows about cats and their habits."
+)
+OTHER = "Solar panels convert sunlight into electricity with increasing efficiency."
+
+
+def _source(id, url, full_text):
+    return SimpleNamespace(id=id, url=url, full_text=full_text)
+
+
+def test_find_ignores_case_and_punctuation():
+    start, end, score = PassageIndex(TEXT).find("the quick brown fox jumps over")
+    assert TEXT[start:end] == "The Quick brown fox, jumps over"
+    assert score == 1.0
+
+
+def test_find_unrelated_query_returns_none():
+    assert PassageIndex(TEXT).find("quantum computing breaks modern encryption") is None
+
+
+def test_find_short_query_returns_none():
+    assert PassageIndex(TEXT).find("the") is None
+    assert PassageIndex(TEXT).find("quick brown") is None
+
+
+def test_find_spans_only_matched_words():
+    text = (
+        "Budget cuts hit schools hard. Solar panels convert sunlight into "
+        "electricity with growing efficiency. More text."
+    )
+    index = PassageIndex(text)
+    start, end, _ = index.find("Researchers note that solar panels convert sunlight into electricity")
+    assert text[start:end] == "Solar panels convert sunlight into electricity"
+    start, end, _ = index.find("solar panels convert sunlight into electricity and much more besides")
+    assert text[start:end] == "Solar panels convert sunlight into electricity"
+
+
+def test_find_tolerates_inserted_and_dropped_words():
+    text = "The company reported revenue of 5 billion dollars in 2023, up from 4 billion the previous year."
+    start, end, score = PassageIndex(text).find("revenue of $5 billion in 2023, up from $4 billion")
+    assert text[start:end] == "revenue of 5 billion dollars in 2023, up from 4 billion"
+    assert score >= REASSIGN_SCORE
+
+
+def test_cited_source_miss_falls_back_to_other_source():
+    sources = [_source(1, "https://a.com/post", TEXT), _source(2, "https://b.com/", OTHER)]
+    key_points = [{
+        "point": "Solar",
+        "source_url": "https://A.com/post/",
+        "snippet": "Solar panels convert sunlight into electricity",
+    }]
+    [m] = attribute_key_points(key_points, sources)
+    assert m["source_id"] == 2
+    assert OTHER[m["start"]:m["end"]] == "Solar panels convert sunlight into electricity"
+
+
+def test_weak_match_keeps_cited_source():
+    sources = [_source(1, "https://a.com", TEXT), _source(2, "https://b.com", OTHER)]
+    key_points = [{
+        "point": "p",
+        "source_url": "https://a.com",
+        "snippet": "panels convert sunlight and also many other unrelated words here",
+    }]
+    assert attribute_key_points(key_points, sources) == [
+        {"source_id": 1, "start": None, "end": None}
+    ]
+
+
+def test_no_match_keeps_cited_source_with_null_offsets():
+    sources = [_source(1, "https://a.com", TEXT), _source(2, "https://b.com", OTHER)]
+    key_points = [{"point": "p", "source_url": "https://b.com/", "snippet": "zebras migrate across the savanna"}]
+    assert attribute_key_points(key_points, sources) == [
+        {"source_id": 2, "start": None, "end": None}
+    ]
@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database import Base, get_db
+from main import app
+from models import Attribution, Brief, Source
+from routers import briefs
+
+TEXT_A = "Intro text here. The quick brown fox jumps over the lazy dog. Then more about cats."
+TEXT_B = "Solar panels convert sunlight into electricity with growing efficiency."
+
+
+@pytest.fixture
+def sessionmaker(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def override_get_db():
+        async with maker() as session:
+            yield session
+
+    asyncio.run(setup())
+    app.dependency_overrides[get_db] = override_get_db
+    yield maker
+    app.dependency_overrides.clear()
+    asyncio.run(engine.dispose())
+
+
+async def _get(path):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def _insert_legacy_brief(maker, key_points, attributions=()):
+    """A brief stored before attributions existed (optionally with some rows)."""
+    async with maker() as db:
+        brief = Brief(
+            title="Legacy", summary="s", key_points=json.dumps(key_points),
+            conflicting_claims="[]", verify_checklist="[]", topic_tags='["t"]',
+        )
+        db.add(brief)
+        await db.flush()
+        for url, text in (("https://a.com", TEXT_A), ("https://b.com", TEXT_B)):
+            db.add(Source(brief_id=brief.id, url=url, title=url, full_text=text))
+        for m in attributions:
+            db.add(Attribution(brief_id=brief.id, **m))
+        await db.commit()
+        return brief.id
+
+
+async def _count_attributions(maker, brief_id):
+    async with maker() as db:
+        result = await db.execute(
+            select(func.count()).where(Attribution.brief_id == brief_id)
+        )
+        return result.scalar_one()
+
+
+def test_create_then_compare(sessionmaker, monkeypatch):
+    async def fake_fetch(url):
+        return {"url": url, "title": None, "text": TEXT_A if "a.com" in url else TEXT_B, "error": None}
+
+    async def fake_generate(sources):
+        return {
+            "title": "Brief", "summary": "s", "conflicting_claims": [],
+            "verify_checklist": [], "topic_tags": ["t"],
+            "key_points": [
+                {"point": "Fox", "source_url": "https://a.com", "snippet": "the quick brown fox jumps"},
+                {"point": "Solar", "source_url": "https://b.com/", "snippet": "solar panels convert sunlight"},
+            ],
+        }
+
+    monkeypatch.setattr(briefs, "fetch_and_clean", fake_fetch)
+    monkeypatch.setattr(briefs, "generate_brief", fake_generate)
+
+    async def run():
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            created = await client.post("/api/briefs", json={"urls": ["https://a.com", "https://b.com"]})
+            assert created.status_code == 201
+            snippets = [s["snippet"] for s in created.json()["sources"]]
+            assert snippets == ["The quick brown fox jumps", "Solar panels convert sunlight"]
+            return await client.get(f"/api/briefs/{created.json()['id']}/compare")
+
+    body = asyncio.run(run()).json()
+    a, b = body["sources"]
+    assert a["key_points"] == [0] and b["key_points"] == [1]
+    assert body["key_points"][0]["snippet"] == "The quick brown fox jumps"
+    assert body["key_points"][1]["source_id"] == b["id"]
+
+
+def test_compare_unknown_brief_returns_404(sessionmaker):
+    assert asyncio.run(_get("/api/briefs/999/compare")).status_code == 404
+
+
+def test_compare_backfills_legacy_brief_once(sessionmaker):
+    key_points = [
+        {"point": "Fox", "source_url": "https://a.com", "snippet": "quick brown fox jumps over"},
+        {"point": None, "source_url": "https://nowhere.com", "snippet": "zebras migrate across the savanna"},
+    ]
+    brief_id = asyncio.run(_insert_legacy_brief(sessionmaker, key_points))
+
+    first = asyncio.run(_get(f"/api/briefs/{brief_id}/compare"))
+    second = asyncio.run(_get(f"/api/briefs/{brief_id}/compare"))
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert asyncio.run(_count_attributions(sessionmaker, brief_id)) == 2
+
+    fox, unmatched = first.json()["key_points"]
+    assert fox["snippet"] == "quick brown fox jumps over"
+    assert unmatched == {"point": "", "source_id": None, "snippet": None, "start": None, "end": None}
+
+
+def test_compare_key_point_without_row_is_null(sessionmaker):
+    key_points = [
+        {"point": "Fox", "source_url": "https://a.com", "snippet": "quick brown fox jumps over"},
+        {"point": "Solar", "source_url": "https://b.com", "snippet": "solar panels convert sunlight"},
+    ]
+    rows = [{"key_point_index": 1, "source_id": None, "start": None, "end": None}]
+    brief_id = asyncio.run(_insert_legacy_brief(sessionmaker, key_points, rows))
+
+    body = asyncio.run(_get(f"/api/briefs/{brief_id}/compare")).json()
+    assert body["key_points"][0] == {
+        "point": "Fox", "source_id": None, "snippet": None, "start": None, "end": None,
+    }
+    assert all(s["key_points"] == [] for s in body["sources"])
+
+
+def test_compare_concurrent_backfill_uses_existing_rows(sessionmaker, monkeypatch):
+    key_points = [{"point": "Fox", "source_url": "https://a.com", "snippet": "quick brown fox jumps over"}]
+    # The other request's rows: committed after our read, so we still see none
+    winner = [{"key_point_index": 0, "source_id": None, "start": None, "end": None}]
+    brief_id = asyncio.run(_insert_legacy_brief(sessionmaker, key_points, winner))
+
+    load = briefs._load_attributions
+    calls = []
+
+    async def stale_first_load(db, brief_id):
+        calls.append(brief_id)
+        return [] if len(calls) == 1 else await load(db, brief_id)
+
+    monkeypatch.setattr(briefs, "_load_attributions", stale_first_load)
+
+    response = asyncio.run(_get(f"/api/briefs/{brief_id}/compare"))
+    assert response.status_code == 200
+    assert response.json()["key_points"][0]["source_id"] is None
+    assert len(calls) == 2
+    assert asyncio.run(_count_attributions(sessionmaker, brief_id)) == 1
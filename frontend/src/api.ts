@@ -45,6 +45,30 @@ export interface Brief {
   sources: Source[]
 }
 
+export interface CompareKeyPoint {
+  point: string
+  source_id: number | null
+  snippet: string | null
+  start: number | null
+  end: number | null
+}
+
+export interface CompareSource {
+  id: number
+  url: string
+  title: string | null
+  key_points: number[]
+}
+
+export interface Compare {
+  id: number
+  title: string
+  topic_tags: string[]
+  key_points: CompareKeyPoint[]
+  sources: CompareSource[]
+  conflicting_claims: ConflictingClaim[]
+}
+
 export interface HealthStatus {
   backend: string
   database: string
@@ -60,5 +84,8 @@ export const listBriefs = () =>
 export const getBrief = (id: number) =>
   api.get<Brief>(`/api/briefs/${id}`).then(r => r.data)
 
+export const getCompare = (id: number) =>
+  api.get<Compare>(`/api/briefs/${id}/compare`).then(r => r.data)
+
 export const getHealth = () =>
   api.get<HealthStatus>('/api/health').then(r => r.data)
@@ -1,19 +1,19 @@
 import { useEffect, useState } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
-import { getBrief } from '../api'
-import type { Brief } from '../api'
+import { getCompare } from '../api'
+import type { Compare } from '../api'
 
 export default function CompareSourcesPage() {
     const { id } = useParams<{ id: string }>()
     const navigate = useNavigate()
-    const [brief, setBrief] = useState<Brief | null>(null)
+    const [compare, setCompare] = useState<Compare | null>(null)
     const [loading, setLoading] = useState(true)
     const [error, setError] = useState('')
 
     useEffect(() => {
         if (!id) return
-        getBrief(Number(id))
-            .then(b => { setBrief(b); setLoading(false) })
+        getCompare(Number(id))
+            .then(c => { setCompare(c); setLoading(false) })
             .catch(e => { setError(e.message); setLoading(false) })
     }, [id])
 
@@ -23,7 +23,7 @@ export default function CompareSourcesPage() {
         </div>
     )
 
-    if (error || !brief) return (
+    if (error || !compare) return (
         <div className="page">
             <div className="empty-state">
                 <h3>{error || 'Brief not found'}</h3>
@@ -31,29 +31,16 @@ export default function CompareSourcesPage() {
         </div>
     )
 
-    // Build compare matrix: key_points grouped by source
-    const sourceMap: Record<string, { title: string; points: string[] }> = {}
-    for (const src of brief.sources) {
-        sourceMap[src.url] = { title: src.title || src.url, points: [] }
-    }
-    for (const kp of brief.key_points) {
-        if (sourceMap[kp.source_url]) {
-            sourceMap[kp.source_url].points.push(kp.point)
-        }
-    }
-
-    const sources = Object.entries(sourceMap)
-
     return (
         <div className="page fade-up">
             <button className="btn btn-secondary btn-sm" style={{ marginBottom: 20 }} onClick={() => navigate(`/brief/${id}`)}>
                 Back to Brief
             </button>
             <h1 className="page-title">Compare Sources</h1>
-            <p className="page-subtitle">{brief.title}</p>
+            <p className="page-subtitle">{compare.title}</p>
 
             <div style={{ marginBottom: 20 }}>
-                {brief.topic_tags.map(t => <span key={t} className="tag">{t}</span>)}
+                {compare.topic_tags.map(t => <span key={t} className="tag">{t}</span>)}
             </div>
 
             <div style={{ overflowX: 'auto' }}>
@@ -65,21 +52,28 @@ export default function CompareSourcesPage() {
                         </tr>
                     </thead>
                     <tbody>
-                        {sources.map(([url, data]) => (
-                            <tr key={url}>
+                        {compare.sources.map(src => (
+                            <tr key={src.id}>
                                 <td>
                                     <div style={{ fontWeight: 600, fontSize: '0.85rem', marginBottom: 5 }}>
-                                        {data.title === url ? '' : data.title}
+                                        {src.title && src.title !== src.url ? src.title : ''}
                                     </div>
-                                    <a className="src-url" href={url} target="_blank" rel="noopener noreferrer">{url}</a>
+                                    <a className="src-url" href={src.url} target="_blank" rel="noopener noreferrer">{src.url}</a>
                                 </td>
                                 <td>
-                                    {data.points.length === 0 ? (
+                                    {src.key_points.length === 0 ? (
                                         <span style={{ color: 'var(--text-muted)', fontSize: '0.82rem' }}>No key points attributed to this source</span>
                                     ) : (
                                         <ul style={{ paddingLeft: 16 }}>
-                                            {data.points.map((p, i) => (
-                                                <li key={i} style={{ marginBottom: 7, fontSize: '0.87rem' }}>{p}</li>
+                                            {src.key_points.map(i => (
+                                                <li key={i} style={{ marginBottom: 7, fontSize: '0.87rem' }}>
+                                                    {compare.key_points[i].point}
+                                                    {compare.key_points[i].snippet && (
+                                                        <div style={{ color: 'var(--text-muted)', fontSize: '0.8rem', fontStyle: 'italic', marginTop: 3 }}>
+                                                            “{compare.key_points[i].snippet}”
+                                                        </div>
+                                                    )}
+                                                </li>
                                             ))}
                                         </ul>
                                     )}
@@ -91,10 +85,10 @@ export default function CompareSourcesPage() {
             </div>
 
             {/* Conflicts panel */}
-            {brief.conflicting_claims.length > 0 && (
+            {compare.conflicting_claims.length > 0 && (
                 <div className="card" style={{ marginTop: 28 }}>
                     <p className="section-label">Conflicting Claims</p>
-                    {brief.conflicting_claims.map((c, i) => (
+                    {compare.conflicting_claims.map((c, i) => (
                         <div className="conflict-card" key={i}>
                             {c.topic && <strong style={{ fontSize: '0.9rem' }}>{c.topic}</strong>}
                             <div className="conflict-grid">